@@ -8,14 +8,20 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
 import json
+import copy
+import hashlib
 import os
+import re
 import sys
 import subprocess
 import time
 import random
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 import requests
+from requests.adapters import HTTPAdapter
 from docx import Document
 from bs4 import BeautifulSoup
 from selenium import webdriver
@@ -38,25 +44,45 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Outermost {...} object and [{...}, ...] array of objects in an LLM response, compiled once for all parses
+_RE_JSON_OBJECT = re.compile(r'\{.*\}', re.DOTALL)
+_RE_JSON_ARRAY = re.compile(r'\[\s*\{.*\}\s*\]', re.DOTALL)
+
 class OllamaManager:
     """Manages Ollama LLM integration for job analysis and cover letter generation"""
     
     def __init__(self, endpoint: str = "http://localhost:11434", model: str = "llama3:latest"):
         self.endpoint = endpoint
         self.model = model
+        # Keep-alive connections to the Ollama server, shared by every query
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_connections=2, pool_maxsize=8))
+        # Recent job analyses, keyed on a digest of their inputs
+        self.cache_size = 512
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Stream generations so JSON answers can be returned as soon as they close
+        self.stream = True
+        # Independent batch prompts sent to Ollama at the same time
+        self.max_concurrent_requests = 2
+        # Context window (num_ctx) sent with every request; one fixed value so Ollama never reloads
+        # the model between calls, sized for a full analysis batch (None keeps the Modelfile's value)
+        self.num_ctx = 8192
+        # Job descriptions are cut to this many characters in batch prompts
+        self.max_description_chars = 3000
         self.available = self._check_availability()
         
     def _check_availability(self) -> bool:
         """Check if Ollama is running and accessible"""
         try:
-            response = requests.get(f"{self.endpoint}/api/tags", timeout=5)
+            response = self.session.get(f"{self.endpoint}/api/tags", timeout=5)
             return response.status_code == 200
         except Exception as e:
             logger.warning(f"Ollama not available: {e}")
             return False
     
-    def query(self, prompt: str, max_tokens: int = 1024) -> Optional[str]:
-        """Query Ollama with a prompt"""
+    def query(self, prompt: str, max_tokens: int = 1024, json_start: Optional[str] = None) -> Optional[str]:
+        """Query Ollama with a prompt; with json_start ('{' or '['), stop once the JSON value it opens is complete"""
         if not self.available:
             return None
             
@@ -64,33 +90,146 @@ class OllamaManager:
             payload = {
                 "model": self.model,
                 "prompt": prompt,
-                "stream": False,
+                "stream": self.stream,
                 "options": {
                     "num_predict": max_tokens,
                     "temperature": 0.7,
                     "top_p": 0.9
                 }
             }
+            if self.num_ctx:
+                payload["options"]["num_ctx"] = self.num_ctx
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.endpoint}/api/generate",
                 json=payload,
-                timeout=30
+                timeout=30,
+                stream=self.stream
             )
             
             if response.status_code == 200:
+                if self.stream:
+                    return self._read_stream(response, json_start)
                 result = response.json()
-                return result.get('response', '').strip()
+                text = result.get('response', '').strip()
+                if json_start:
+                    return self._first_json_value(text, json_start) or text
+                return text
             else:
                 logger.error(f"Ollama API error: {response.status_code}")
+                response.close()
                 return None
                 
         except Exception as e:
             logger.error(f"Error querying Ollama: {e}")
             return None
     
+    def _read_stream(self, response, json_start: Optional[str]) -> str:
+        """Collect a streamed generation; with json_start, stop once that JSON value closes and return just it"""
+        parts = []
+        answer = None
+        received = 0
+        # Offset of the json_start character that opened the current candidate value
+        start = None
+        depth = 0
+        in_string = escaped = False
+        try:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                text = chunk.get('response', '')
+                parts.append(text)
+                offset = received
+                received += len(text)
+                
+                if json_start:
+                    for position, char in enumerate(text, offset):
+                        if start is None:
+                            # Prose before the answer is skipped, brackets included
+                            if char == json_start:
+                                start, depth = position, 1
+                            continue
+                        # Track bracket depth outside of string literals
+                        if in_string:
+                            if escaped:
+                                escaped = False
+                            elif char == '\\':
+                                escaped = True
+                            elif char == '"':
+                                in_string = False
+                        elif char == '"':
+                            in_string = True
+                        elif char in '{[':
+                            depth += 1
+                        elif char in '}]':
+                            depth -= 1
+                            if depth == 0:
+                                candidate = ''.join(parts)[start:position + 1]
+                                try:
+                                    json.loads(candidate)
+                                    answer = candidate
+                                    break
+                                except ValueError:
+                                    # Bracketed text that is not the answer; keep looking
+                                    start = None
+                    if answer is not None:
+                        # Closing the connection makes Ollama stop generating
+                        break
+                
+                if chunk.get('done'):
+                    break
+        finally:
+            response.close()
+        
+        if answer is not None:
+            return answer
+        return ''.join(parts).strip()
+    
+    @staticmethod
+    def _first_json_value(text: str, json_start: str) -> Optional[str]:
+        """Return the first complete JSON value in text that opens with json_start, if any"""
+        decoder = json.JSONDecoder()
+        position = text.find(json_start)
+        while position != -1:
+            try:
+                _, end = decoder.raw_decode(text, position)
+                return text[position:end]
+            except ValueError:
+                position = text.find(json_start, position + 1)
+        return None
+    
+    def _cache_key(self, kind: str, *parts: str) -> str:
+        """Build a cache key from the request kind, the model and the prompt inputs"""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (kind, self.model) + parts:
+            digest.update(part.encode('utf-8', 'replace'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Return a copy of a cached result and mark it as recently used"""
+        with self._cache_lock:
+            if key not in self._cache:
+                return None
+            self._cache.move_to_end(key)
+            return copy.deepcopy(self._cache[key])
+    
+    def _cache_put(self, key: str, value: Any) -> None:
+        """Store a copy of a result, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            self._cache[key] = copy.deepcopy(value)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
     def analyze_job_compatibility(self, job_description: str, resume_text: str) -> Dict[str, Any]:
         """Analyze job compatibility using AI"""
+        cache_key = self._cache_key('analysis', job_description, resume_text)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         prompt = f"""
         Analyze the compatibility between this job description and resume:
         
@@ -116,20 +255,22 @@ class OllamaManager:
         - reasoning
         """
         
-        response = self.query(prompt)
+        response = self.query(prompt, json_start='{')
         if response:
             try:
                 # Try to extract JSON from response
-                import re
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
+                json_match = _RE_JSON_OBJECT.search(response)
                 if json_match:
-                    return json.loads(json_match.group())
-                else:
-                    # Fallback parsing
-                    return self._parse_analysis_response(response)
-            except Exception as e:
+                    analysis = json.loads(json_match.group())
+                    if isinstance(analysis, dict):
+                        # Only parsed answers are cached; placeholders are retried next time
+                        self._cache_put(cache_key, analysis)
+                        return analysis
+            except ValueError as e:
                 logger.error(f"Error parsing AI response: {e}")
-                return self._parse_analysis_response(response)
+            
+            # Fallback parsing
+            return self._parse_analysis_response(response)
         
         return {
             "compatibility_score": 50,
@@ -140,6 +281,130 @@ class OllamaManager:
             "reasoning": "AI analysis unavailable"
         }
     
+    def analyze_jobs_batch(self, job_descriptions: List[str], resume_text: str, batch_size: int = 5,
+                           should_stop: Optional[Callable[[], bool]] = None) -> List[Optional[Dict[str, Any]]]:
+        """Analyze several jobs against one resume, sending one prompt per batch of jobs"""
+        # Checked between rounds of requests; jobs not analyzed before it returns True come back as None
+        should_stop = should_stop or (lambda: False)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(job_descriptions)
+        pending = []
+        for index, job_description in enumerate(job_descriptions):
+            cached = self._cache_get(self._cache_key('analysis', job_description, resume_text))
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append(index)
+        
+        if self.available and pending:
+            batches = self._plan_analysis_batches(pending, job_descriptions, resume_text, batch_size)
+            workers = min(self.max_concurrent_requests, len(batches))
+            # Overlap the batches so their network and queueing latency is paid once
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for start in range(0, len(batches), workers):
+                    if should_stop():
+                        return results
+                    round_batches = batches[start:start + workers]
+                    batch_analyses = executor.map(
+                        lambda batch: self._query_analysis_batch([job_descriptions[i] for i in batch], resume_text),
+                        round_batches
+                    )
+                    for batch, analyses in zip(round_batches, batch_analyses):
+                        for index, analysis in zip(batch, analyses):
+                            if analysis is not None:
+                                results[index] = analysis
+                                self._cache_put(self._cache_key('analysis', job_descriptions[index], resume_text), analysis)
+        
+        # Jobs the batch response did not cover fall back to one request each
+        for index, analysis in enumerate(results):
+            if analysis is None:
+                if should_stop():
+                    break
+                results[index] = self.analyze_job_compatibility(job_descriptions[index], resume_text)
+        
+        return results
+    
+    def _plan_analysis_batches(self, pending: List[int], job_descriptions: List[str], resume_text: str,
+                               batch_size: int) -> List[List[int]]:
+        """Group job indexes into batches whose prompt and reply fit in num_ctx"""
+        if not self.num_ctx:
+            return [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+        
+        # ~3 characters per token over-estimates English text; the resume and instructions are in every prompt
+        budget = self.num_ctx * 3 - len(resume_text) - 1500
+        batches = []
+        batch = []
+        used = 0
+        for index in pending:
+            # Each job costs its (capped) description plus room for its share of the reply
+            cost = min(len(job_descriptions[index]), self.max_description_chars) + 512 * 3
+            if batch and (len(batch) >= batch_size or used + cost > budget):
+                batches.append(batch)
+                batch = []
+                used = 0
+            batch.append(index)
+            used += cost
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    def _query_analysis_batch(self, job_descriptions: List[str], resume_text: str) -> List[Optional[Dict[str, Any]]]:
+        """Query Ollama once for a batch of jobs; entries are None where the response was unusable"""
+        jobs_text = "".join(
+            f"\n        JOB {number}:\n        {job_description[:self.max_description_chars]}\n"
+            for number, job_description in enumerate(job_descriptions, 1)
+        )
+        prompt = f"""
+        Analyze the compatibility between this resume and each of the job descriptions below:
+        
+        RESUME:
+        {resume_text}
+        {jobs_text}
+        For each job provide:
+        1. Compatibility Score (0-100)
+        2. Key Skills Match
+        3. Missing Skills
+        4. Recommendations for improvement
+        5. Should apply (Yes/No) with reasoning
+        
+        Format your response as a JSON array with one object per job, in the same order,
+        each with these keys:
+        - job_index (the job number above)
+        - compatibility_score
+        - skills_match
+        - missing_skills
+        - recommendations
+        - should_apply
+        - reasoning
+        """
+        
+        analyses: List[Optional[Dict[str, Any]]] = [None] * len(job_descriptions)
+        response = self.query(prompt, max_tokens=min(4096, 512 * len(job_descriptions)), json_start='[')
+        if not response:
+            return analyses
+        
+        try:
+            json_match = _RE_JSON_ARRAY.search(response)
+            items = json.loads(json_match.group()) if json_match else []
+        except ValueError as e:
+            logger.error(f"Error parsing batched AI response: {e}")
+            return analyses
+        
+        if not isinstance(items, list):
+            return analyses
+        
+        for position, item in enumerate(items):
+            if not isinstance(item, dict):
+                continue
+            index = item.pop('job_index', position + 1)
+            try:
+                index = int(index) - 1
+            except (TypeError, ValueError):
+                index = position
+            if 0 <= index < len(analyses) and analyses[index] is None:
+                analyses[index] = item
+        
+        return analyses
+    
     def _parse_analysis_response(self, response: str) -> Dict[str, Any]:
         """Parse AI response when JSON parsing fails"""
         return {
@@ -152,7 +417,7 @@ class OllamaManager:
         }
     
     def generate_cover_letter(self, job_description: str, resume_text: str, company_name: str = "") -> str:
-        """Generate a personalized cover letter"""
+        """Generate a personalized cover letter (not cached, so each request gives a fresh draft)"""
         prompt = f"""
         Generate a professional cover letter for this job application:
         
@@ -234,17 +499,16 @@ class OllamaManager:
         Return only valid JSON.
         """
         
-        response = self.query(prompt, max_tokens=1500)
+        response = self.query(prompt, max_tokens=1500, json_start='{')
         if response:
             try:
                 # Try to extract JSON from response
-                import re
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
+                json_match = _RE_JSON_OBJECT.search(response)
                 if json_match:
                     return json.loads(json_match.group())
                 else:
                     return None
-            except Exception as e:
+            except ValueError as e:
                 logger.error(f"Error parsing job details response: {e}")
                 return None
         
@@ -279,9 +543,7 @@ class ResumeParser:
         """Parse DOCX resume"""
         try:
             doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+            text = "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
             
             return self._extract_info_from_text(text)
         except Exception as e:
@@ -294,9 +556,7 @@ class ResumeParser:
             import PyPDF2
             with open(file_path, 'rb') as file:
                 reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
+                text = "".join(page.extract_text() + "\n" for page in reader.pages)
             
             return self._extract_info_from_text(text)
         except Exception as e:
@@ -340,12 +600,57 @@ class ResumeParser:
 class JobScraper:
     """Scrapes job postings from various job sites"""
     
+    # XPath candidates for each LinkedIn job card field, relative to the card and tried in order
+    LINKEDIN_JOB_CARD_FIELDS = {
+        'title': [
+            ".//h3[contains(@class, 'job-title')]",
+            ".//h3[contains(@class, 'title')]",
+            ".//a[contains(@class, 'job-title')]",
+            ".//span[contains(@class, 'job-title')]",
+            ".//div[contains(@class, 'job-title')]",
+            ".//h4[contains(@class, 'job-title')]"
+        ],
+        'company': [
+            ".//h4[contains(@class, 'company')]",
+            ".//span[contains(@class, 'company')]",
+            ".//div[contains(@class, 'company')]",
+            ".//a[contains(@class, 'company')]",
+            ".//span[contains(@class, 'company-name')]"
+        ],
+        'location': [
+            ".//span[contains(@class, 'location')]",
+            ".//div[contains(@class, 'location')]",
+            ".//span[contains(@class, 'job-location')]",
+            ".//div[contains(@class, 'job-location')]"
+        ],
+        'description': [
+            ".//div[contains(@class, 'description')]",
+            ".//span[contains(@class, 'description')]",
+            ".//div[contains(@class, 'job-description')]",
+            ".//p[contains(@class, 'description')]"
+        ],
+        'posted_time': [
+            ".//span[contains(@class, 'time')]",
+            ".//span[contains(@class, 'posted')]",
+            ".//div[contains(@class, 'time')]",
+            ".//span[contains(@class, 'job-posted')]"
+        ]
+    }
+    
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         self.driver = None
+        # Type form input in a few bursts rather than a single send_keys call
+        self.stealth_typing = False
+        # Run Chrome without a window (leave off when CAPTCHAs need solving by hand)
+        self.headless = False
+        # Upper bound for explicit WebDriverWait conditions in the login flows
+        self.wait_timeout = 15
+        # (st_mtime_ns, parsed credentials) so repeated logins skip re-reading the file
+        self._credentials_cache = (None, None)
     
     def search_jobs(self, keywords: str, location: str = "", site: str = "indeed") -> List[Dict[str, Any]]:
         """Search for jobs on specified site"""
@@ -488,6 +793,9 @@ class JobScraper:
             options.add_argument("--disable-field-trial-config")
             options.add_argument("--disable-ipc-flooding-protection")
             
+            # Page load and rendering performance
+            self._apply_performance_options(options)
+            
             # Random user agent with more variety
             user_agents = [
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -545,6 +853,9 @@ class JobScraper:
             chrome_options.add_argument("--disable-field-trial-config")
             chrome_options.add_argument("--disable-ipc-flooding-protection")
             
+            # Page load and rendering performance
+            self._apply_performance_options(chrome_options)
+            
             # Experimental options for stealth
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
@@ -580,6 +891,16 @@ class JobScraper:
         
         return driver
 
+    def _apply_performance_options(self, options):
+        """Apply Chrome options that cut page load time without changing page behavior"""
+        # Return from get() at DOMContentLoaded; explicit waits cover the rest
+        options.page_load_strategy = 'eager'
+        if self.headless:
+            options.add_argument("--headless=new")
+            # Nobody sees a headless window, so skip image downloads and decoding; a visible
+            # window keeps images for CAPTCHA challenges and the user's own browsing
+            options.add_argument("--blink-settings=imagesEnabled=false")
+
     def _apply_human_behavior_scripts(self, driver):
         """Apply scripts to make the browser behave more like a human"""
         try:
@@ -1200,32 +1521,25 @@ class JobScraper:
         time.sleep(final_delay)
     
     def _human_like_typing(self, element, text):
-        """Simulate human-like typing with realistic patterns"""
+        """Type text into a field with a single send_keys call (a few bursts in stealth mode)"""
         try:
             # Clear field with human-like behavior
             element.clear()
             time.sleep(random.uniform(0.1, 0.3))
             
-            # Type with variable speed (faster at start, slower for corrections)
-            for i, char in enumerate(text):
-                element.send_keys(char)
-                
-                # Variable typing speed based on position and character type
-                if i < len(text) * 0.3:  # First 30% - faster typing
-                    delay = random.uniform(0.03, 0.08)
-                elif i < len(text) * 0.8:  # Middle section - normal speed
-                    delay = random.uniform(0.05, 0.12)
-                else:  # Last 20% - slower, more careful
-                    delay = random.uniform(0.08, 0.18)
-                
-                # Add occasional longer pauses (like thinking)
-                if random.random() < 0.05:  # 5% chance of longer pause
-                    delay += random.uniform(0.2, 0.5)
-                
-                time.sleep(delay)
+            if self.stealth_typing and len(text) > 3:
+                # Type in 2-3 bursts for sites that fingerprint instant input
+                num_chunks = random.randint(2, 3)
+                chunk_size = -(-len(text) // num_chunks)
+                for start in range(0, len(text), chunk_size):
+                    element.send_keys(text[start:start + chunk_size])
+                    time.sleep(random.uniform(0.1, 0.3))
+            else:
+                # One WebDriver round-trip instead of one per character
+                element.send_keys(text)
             
             # Final pause after typing
-            time.sleep(random.uniform(0.2, 0.5))
+            time.sleep(random.uniform(0.05, 0.15))
             
         except Exception as e:
             logger.warning(f"Error in human-like typing: {e}")
@@ -1341,8 +1655,8 @@ class JobScraper:
     def open_browser_search(self, keywords: str, location: str = "", site: str = "indeed") -> bool:
         """Open browser and perform job search on selected platform"""
         try:
-            # Initialize driver
-            self.driver = self._setup_driver()
+            # Reuse the open browser when possible
+            self._ensure_driver()
             
             if site.lower() == "indeed":
                 return self._open_indeed_search(keywords, location)
@@ -1358,6 +1672,24 @@ class JobScraper:
             logger.error(f"Error opening browser search: {e}")
             return False
     
+    def _ensure_driver(self):
+        """Return the open browser if it still responds, otherwise start a new one"""
+        if self.driver:
+            try:
+                # Cheap round-trip that fails if Chrome crashed or was closed by the user
+                self.driver.title
+                return self.driver
+            except Exception as e:
+                logger.info(f"Existing browser is no longer responsive, starting a new one: {e}")
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+                self.driver = None
+        
+        self.driver = self._setup_driver()
+        return self.driver
+    
     def _open_indeed_search(self, keywords: str, location: str) -> bool:
         """Open Indeed and perform search"""
         try:
@@ -1467,10 +1799,9 @@ class JobScraper:
         try:
             # Navigate to login page
             self.driver.get("https://www.linkedin.com/login")
-            self._human_like_delay(3, 5)
             
-            # Wait for page to load
-            wait = WebDriverWait(self.driver, 15)
+            # Wait for page to load (the login handler waits on explicit conditions)
+            wait = WebDriverWait(self.driver, self.wait_timeout)
             
             # Perform LinkedIn login
             login_success = self._handle_linkedin_login(wait)
@@ -2124,114 +2455,74 @@ class JobScraper:
     def _extract_linkedin_job_info(self, job_card):
         """Extract job information from a LinkedIn job card"""
         try:
-            job_info = {}
-            
-            # Extract job title
-            title_selectors = [
-                ".//h3[contains(@class, 'job-title')]",
-                ".//h3[contains(@class, 'title')]",
-                ".//a[contains(@class, 'job-title')]",
-                ".//span[contains(@class, 'job-title')]",
-                ".//div[contains(@class, 'job-title')]",
-                ".//h4[contains(@class, 'job-title')]"
-            ]
-            
-            for selector in title_selectors:
-                try:
-                    title_elem = job_card.find_element(By.XPATH, selector)
-                    if title_elem and title_elem.text.strip():
-                        job_info['title'] = title_elem.text.strip()
-                        break
-                except:
-                    continue
-            
-            # Extract company name
-            company_selectors = [
-                ".//h4[contains(@class, 'company')]",
-                ".//span[contains(@class, 'company')]",
-                ".//div[contains(@class, 'company')]",
-                ".//a[contains(@class, 'company')]",
-                ".//span[contains(@class, 'company-name')]"
-            ]
-            
-            for selector in company_selectors:
-                try:
-                    company_elem = job_card.find_element(By.XPATH, selector)
-                    if company_elem and company_elem.text.strip():
-                        job_info['company'] = company_elem.text.strip()
-                        break
-                except:
-                    continue
-            
-            # Extract location
-            location_selectors = [
-                ".//span[contains(@class, 'location')]",
-                ".//div[contains(@class, 'location')]",
-                ".//span[contains(@class, 'job-location')]",
-                ".//div[contains(@class, 'job-location')]"
-            ]
-            
-            for selector in location_selectors:
-                try:
-                    location_elem = job_card.find_element(By.XPATH, selector)
-                    if location_elem and location_elem.text.strip():
-                        job_info['location'] = location_elem.text.strip()
-                        break
-                except:
-                    continue
-            
-            # Extract job description (if available in card)
-            desc_selectors = [
-                ".//div[contains(@class, 'description')]",
-                ".//span[contains(@class, 'description')]",
-                ".//div[contains(@class, 'job-description')]",
-                ".//p[contains(@class, 'description')]"
-            ]
-            
-            for selector in desc_selectors:
-                try:
-                    desc_elem = job_card.find_element(By.XPATH, selector)
-                    if desc_elem and desc_elem.text.strip():
-                        job_info['description'] = desc_elem.text.strip()
-                        break
-                except:
-                    continue
+            try:
+                # Read every field in one WebDriver round-trip
+                job_info = self._extract_card_fields_via_js(job_card, self.LINKEDIN_JOB_CARD_FIELDS)
+            except Exception as e:
+                logger.debug(f"Batched card extraction failed, reading fields one by one: {e}")
+                job_info = self._extract_card_fields(job_card, self.LINKEDIN_JOB_CARD_FIELDS)
             
             # If no description in card, try to click and read full description
             if not job_info.get('description'):
                 job_info['description'] = self._read_linkedin_full_job_description(job_card)
             
-            # Extract posting time
-            time_selectors = [
-                ".//span[contains(@class, 'time')]",
-                ".//span[contains(@class, 'posted')]",
-                ".//div[contains(@class, 'time')]",
-                ".//span[contains(@class, 'job-posted')]"
-            ]
-            
-            for selector in time_selectors:
-                try:
-                    time_elem = job_card.find_element(By.XPATH, selector)
-                    if time_elem and time_elem.text.strip():
-                        job_info['posted_time'] = time_elem.text.strip()
-                        break
-                except:
-                    continue
-            
-            # Extract job URL if available
-            try:
-                link_elem = job_card.find_element(By.XPATH, ".//a[contains(@href, '/jobs/')]")
-                if link_elem:
-                    job_info['url'] = link_elem.get_attribute('href')
-            except:
-                pass
-            
             return job_info
             
         except Exception as e:
             logger.warning(f"Error extracting job info: {e}")
             return None
 
+    def _extract_card_fields_via_js(self, job_card, field_selectors):
+        """Extract card fields with a single execute_script call (first non-empty match per field)"""
+        job_info = self.driver.execute_script("""
+            const card = arguments[0], fields = arguments[1], info = {};
+            const first = (xpath) => document.evaluate(
+                xpath, card, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            for (const [name, xpaths] of Object.entries(fields)) {
+                for (const xpath of xpaths) {
+                    const node = first(xpath);
+                    const text = node ? (node.innerText || '').trim() : '';
+                    if (text) {
+                        info[name] = text;
+                        break;
+                    }
+                }
+            }
+            const link = first(".//a[contains(@href, '/jobs/')]");
+            if (link) {
+                info.url = link.href;
+            }
+            return info;
+        """, job_card, field_selectors)
+        
+        if not isinstance(job_info, dict):
+            raise ValueError(f"Unexpected card extraction result: {job_info!r}")
+        return job_info
+
+    def _extract_card_fields(self, job_card, field_selectors):
+        """Extract card fields with one find_element call per selector"""
+        job_info = {}
+        
+        for field, selectors in field_selectors.items():
+            for selector in selectors:
+                try:
+                    elem = job_card.find_element(By.XPATH, selector)
+                    if elem and elem.text.strip():
+                        job_info[field] = elem.text.strip()
+                        break
+                except:
+                    continue
+        
+        # Extract job URL if available
+        try:
+            link_elem = job_card.find_element(By.XPATH, ".//a[contains(@href, '/jobs/')]")
+            if link_elem:
+                job_info['url'] = link_elem.get_attribute('href')
+        except:
+            pass
+        
+        return job_info
+
     def _read_linkedin_full_job_description(self, job_card):
         """Read the full job description by clicking on the job card"""
         try:
@@ -2475,10 +2766,7 @@ class JobScraper:
             except Exception as e:
                 logger.warning(f"Login page load check failed: {e}")
             
-            # Wait for page to stabilize and prevent race conditions
-            self._human_like_delay(5, 8)
-            
-            # Additional stability check - wait for any loading indicators to disappear
+            # Stability check - wait for any loading indicators to disappear
             self._wait_for_linkedin_page_stable()
             
             # Handle any popups or overlays that might interfere with login
@@ -2527,11 +2815,15 @@ class JobScraper:
                 return False
             
             # Click sign in button with stealth
+            login_url = self.driver.current_url
             self._stealth_click_element(signin_button)
             logger.info("Clicked LinkedIn sign in button with enhanced human-like behavior")
             
-            # Step 4: Wait for login to complete
-            self._human_like_delay(5, 8)
+            # Step 4: Wait for login to complete (LinkedIn leaves the login page on success)
+            try:
+                wait.until(EC.url_changes(login_url))
+            except TimeoutException:
+                logger.info("Still on the login page after sign in, checking for errors")
             
             # Check for error messages after login attempt
             if self._check_for_linkedin_error_messages():
@@ -2554,9 +2846,15 @@ class JobScraper:
                 logger.warning(f"Credentials file {credentials_file} not found")
                 return None
             
+            mtime = os.stat(credentials_file).st_mtime_ns
+            cached_mtime, cached_credentials = self._credentials_cache
+            if cached_mtime == mtime:
+                return cached_credentials
+            
             with open(credentials_file, 'r') as f:
                 credentials = json.load(f)
             
+            self._credentials_cache = (mtime, credentials)
             logger.info("User credentials loaded successfully")
             return credentials
             
@@ -3045,9 +3343,15 @@ class JobScraper:
     def _verify_linkedin_login(self) -> bool:
         """Verify LinkedIn login success with enhanced session recognition"""
         try:
-            # Wait longer for page to fully load and session to be recognized
-            self._human_like_delay(5, 8)
-            
+            # The sign-in step already waited for the URL change; poll for a logged-in
+            # indicator rather than sleeping a fixed 5-8 s before the first check
+            try:
+                WebDriverWait(self.driver, self.wait_timeout).until(lambda driver: self._is_linkedin_logged_in())
+                logger.info("LinkedIn login verification successful")
+                return True
+            except TimeoutException:
+                logger.info("No logged-in indicator yet, falling back to slower checks")
+
             # Check current URL - should not be on login page
             current_url = self.driver.current_url.lower()
             if "login" in current_url:
@@ -3659,6 +3963,32 @@ class JobScraper:
 class AutoJobApplierGUI:
     """Main GUI application for Auto Job Applier"""
     
+    # Apply/submit button XPaths, tried in order by _find_first_clickable
+    LINKEDIN_APPLY_BUTTON_XPATHS = (
+        "//button[contains(text(), 'Apply')]",
+        "//button[contains(text(), 'Easy Apply')]",
+        "//button[contains(text(), 'Apply now')]",
+        "//a[contains(text(), 'Apply')]",
+        "//button[contains(@class, 'apply')]",
+        "//button[contains(@class, 'jobs-apply')]",
+        "//div[contains(@class, 'apply')]//button",
+        "//span[contains(text(), 'Apply')]/parent::button"
+    )
+    LINKEDIN_SUBMIT_BUTTON_XPATHS = (
+        "//button[contains(text(), 'Submit')]",
+        "//button[contains(@class, 'submit')]",
+        "//button[contains(@class, 'send')]"
+    )
+    
+    # Placeholder values for application form fields, keyed by field type
+    LINKEDIN_FIELD_PLACEHOLDERS = {
+        'phone': '+1 (555) 123-4567',
+        'email': 'your.email@example.com',
+        'address': '123 Main St, City, State 12345',
+        'experience': '5+ years in software development',
+        'education': 'Bachelor\'s in Computer Science'
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Auto Job Applier - AI-Powered Job Application Tool")
@@ -3675,6 +4005,10 @@ class AutoJobApplierGUI:
         self.jobs_found = []
         self.current_job = None
         self.is_running = False
+        # Stop the automated pipeline once this many applications have been sent
+        self.max_applications_per_run = 25
+        # Oldest log lines are trimmed beyond this many
+        self.max_log_lines = 100
         
         # Create GUI
         self.create_widgets()
@@ -4118,18 +4452,36 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
     
     def _run_auto_apply(self):
         """Run the actual auto apply process"""
+        # Fetch every description up front so the analyses go to Ollama in batched prompts;
+        # a job whose description can't be fetched is logged and skipped
+        job_descriptions = {}
+        for i, job in enumerate(self.jobs_found):
+            if not self.is_running:
+                return
+            try:
+                job_descriptions[i] = self.job_scraper.get_job_description(job['url'])
+            except Exception as e:
+                self.root.after(0, lambda j=job, e=e: self.log_message(f"❌ Error applying to {j.get('title', 'job')}: {str(e)}"))
+        
+        indexes = list(job_descriptions)
+        self.root.after(0, lambda: self.log_message(f"🤖 Analyzing {len(indexes)} jobs..."))
+        analyses = dict(zip(indexes, self.ollama_manager.analyze_jobs_batch(
+            [job_descriptions[i] for i in indexes],
+            self.resume_data['text'],
+            should_stop=lambda: not self.is_running
+        )))
+        
         for i, job in enumerate(self.jobs_found):
             if not self.is_running:
                 break
+            if analyses.get(i) is None:
+                continue
             
             self.root.after(0, lambda j=job, idx=i: self.log_message(f"📝 Applying to job {idx+1}/{len(self.jobs_found)}: {j['title']}"))
             
             try:
                 # Analyze job compatibility
-                job_description = self.job_scraper.get_job_description(job['url'])
-                analysis = self.ollama_manager.analyze_job_compatibility(
-                    job_description, self.resume_data['text']
-                )
+                analysis = analyses[i]
                 
                 # Only apply if compatibility score is high enough
                 compatibility_score = analysis.get('compatibility_score', 0)
@@ -4173,10 +4525,10 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         self.log_text.insert(tk.END, log_entry)
         self.log_text.see(tk.END)
         
-        # Limit log size
-        lines = self.log_text.get(1.0, tk.END).split('\n')
-        if len(lines) > 100:
-            self.log_text.delete(1.0, f"{len(lines)-100}.0")
+        # Limit log size (line count comes from the end index, not a full text copy)
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > self.max_log_lines:
+            self.log_text.delete(1.0, f"{line_count - self.max_log_lines}.0")
 
     def start_automated_job_application(self):
         """Start the automated job application pipeline"""
@@ -4297,6 +4649,13 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
                         if application_success:
                             successful_applications += 1
                             self.log_message(f"✅ Successfully applied to job {i+1}")
+                            
+                            # Stop here, before the between-jobs delay, once the cap is reached
+                            if successful_applications >= self.max_applications_per_run:
+                                remaining = total_jobs - i - 1
+                                self.log_message(f"🛑 Reached the limit of {self.max_applications_per_run} applications, skipping the remaining {remaining} jobs")
+                                skipped_jobs += remaining
+                                break
                         else:
                             failed_applications += 1
                             self.log_message(f"❌ Failed to apply to job {i+1}")
@@ -4354,13 +4713,11 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
                 'requirements': ['bachelor', 'master', 'phd', 'degree', 'certification', 'experience']
             }
             
+            # Lowercase the description once rather than once per term
+            job_description_lower = job_description.lower()
             result = {}
             for category, terms in keywords.items():
-                found = []
-                for term in terms:
-                    if term.lower() in job_description.lower():
-                        found.append(term)
-                result[category] = found
+                result[category] = [term for term in terms if term in job_description_lower]
             
             return result
             
@@ -4388,9 +4745,8 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             ]
             
             # Check which technical skills are mentioned in the job
-            for skill in technical_skills:
-                if skill.lower() in str(job_info).lower():
-                    skills.add(skill)
+            job_info_lower = str(job_info).lower()
+            skills.update(skill for skill in technical_skills if skill in job_info_lower)
             
             return list(skills)
             
@@ -4414,12 +4770,8 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
                         'machine learning', 'ai', 'data analysis', 'agile', 'scrum'
                     ]
                     
-                    found_skills = []
-                    for skill in common_skills:
-                        if skill.lower() in resume_text.lower():
-                            found_skills.append(skill)
-                    
-                    return found_skills
+                    resume_text_lower = resume_text.lower()
+                    return [skill for skill in common_skills if skill in resume_text_lower]
             
             return []
             
@@ -4436,21 +4788,15 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             if not resume_skills:
                 return 0, [], resume_skills
             
-            # Convert to lowercase for comparison
-            job_skills_lower = [skill.lower() for skill in job_skills]
-            resume_skills_lower = [skill.lower() for skill in resume_skills]
-            
+            # Convert to lowercase sets so each membership check is O(1)
+            job_skills_lower = {skill.lower() for skill in job_skills}
+            resume_skills_lower = {skill.lower() for skill in resume_skills}
+
             # Find matching skills
-            matching_skills = []
-            for skill in resume_skills:
-                if skill.lower() in job_skills_lower:
-                    matching_skills.append(skill)
-            
+            matching_skills = [skill for skill in resume_skills if skill.lower() in job_skills_lower]
+
             # Find missing skills
-            missing_skills = []
-            for skill in job_skills:
-                if skill.lower() not in resume_skills_lower:
-                    missing_skills.append(skill)
+            missing_skills = [skill for skill in job_skills if skill.lower() not in resume_skills_lower]
             
             # Calculate compatibility score
             if len(job_skills) == 0:
@@ -4655,32 +5001,46 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
     def _find_linkedin_apply_button(self):
         """Find the LinkedIn apply button"""
         try:
-            # Multiple selectors for apply button
-            apply_button_selectors = [
-                "//button[contains(text(), 'Apply')]",
-                "//button[contains(text(), 'Easy Apply')]",
-                "//button[contains(text(), 'Apply now')]",
-                "//a[contains(text(), 'Apply')]",
-                "//button[contains(@class, 'apply')]",
-                "//button[contains(@class, 'jobs-apply')]",
-                "//div[contains(@class, 'apply')]//button",
-                "//span[contains(text(), 'Apply')]/parent::button"
-            ]
-            
-            for selector in apply_button_selectors:
-                try:
-                    apply_button = self.driver.find_element(By.XPATH, selector)
-                    if apply_button and apply_button.is_displayed() and apply_button.is_enabled():
-                        return apply_button
-                except:
-                    continue
-            
-            return None
+            return self._find_first_clickable(self.LINKEDIN_APPLY_BUTTON_XPATHS)
             
         except Exception as e:
             self.log_message(f"Error finding apply button: {str(e)}")
             return None
 
+    def _find_first_clickable(self, xpaths):
+        """Return the first displayed, enabled element matching any of the XPaths (single round-trip)"""
+        # The browser belongs to the scraper; the GUI has no driver of its own
+        driver = self.job_scraper.driver
+        if driver is None:
+            return None
+        
+        try:
+            return driver.execute_script("""
+                for (const xpath of arguments[0]) {
+                    const nodes = document.evaluate(
+                        xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                    for (let i = 0; i < nodes.snapshotLength; i++) {
+                        const el = nodes.snapshotItem(i);
+                        if (el.getClientRects().length && !el.disabled) {
+                            return el;
+                        }
+                    }
+                }
+                return null;
+            """, list(xpaths))
+        except Exception as e:
+            logger.debug(f"Script lookup failed, falling back to find_element: {e}")
+        
+        for xpath in xpaths:
+            try:
+                element = driver.find_element(By.XPATH, xpath)
+                if element.is_displayed() and element.is_enabled():
+                    return element
+            except Exception:
+                continue
+        
+        return None
+
     def _handle_linkedin_application_form(self, job_number):
         """Handle LinkedIn application form if it appears"""
         try:
@@ -4795,44 +5155,24 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         """Get appropriate data for a field type"""
         # This would typically come from user profile or resume
         # For now, return placeholder data
-        field_data_map = {
-            'phone': '+1 (555) 123-4567',
-            'email': 'your.email@example.com',
-            'address': '123 Main St, City, State 12345',
-            'experience': '5+ years in software development',
-            'education': 'Bachelor\'s in Computer Science'
-        }
-        
-        return field_data_map.get(field_type, '')
+        return self.LINKEDIN_FIELD_PLACEHOLDERS.get(field_type, '')
 
     def _submit_linkedin_application(self, job_number):
         """Submit the LinkedIn application"""
         try:
             # Look for submit button
-            submit_selectors = [
-                "//button[contains(text(), 'Submit')]",
-                "//button[contains(@class, 'submit')]",
-                "//button[contains(@class, 'send')]"
-            ]
-            
-            for selector in submit_selectors:
-                try:
-                    submit_button = self.driver.find_element(By.XPATH, selector)
-                    if submit_button and submit_button.is_displayed() and submit_button.is_enabled():
-                        self.log_message(f"📤 Submitting application for job {job_number}...")
-                        self._human_like_click(submit_button)
-                        self._human_like_delay(3, 5)
-                        
-                        # Check for success message
-                        if self._check_application_success():
-                            self.log_message(f"✅ Application submitted successfully for job {job_number}")
-                            return True
-                        else:
-                            self.log_message(f"⚠️ Application submission status unclear for job {job_number}")
-                            return True  # Assume success if we can't determine
-                            
-                except:
-                    continue
+            submit_button = self._find_first_clickable(self.LINKEDIN_SUBMIT_BUTTON_XPATHS)
+            if submit_button:
+                self.log_message(f"📤 Submitting application for job {job_number}...")
+                self._human_like_click(submit_button)
+                self._human_like_delay(3, 5)
+                
+                # Check for success message
+                if self._check_application_success():
+                    self.log_message(f"✅ Application submitted successfully for job {job_number}")
+                else:
+                    self.log_message(f"⚠️ Application submission status unclear for job {job_number}")
+                return True  # Assume success if we can't determine
             
             self.log_message(f"⚠️ No submit button found for job {job_number}")
             return False
@@ -4938,27 +5278,7 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
     def _find_linkedin_apply_button(self):
         """Find the LinkedIn apply button"""
         try:
-            # Multiple selectors for apply button
-            apply_button_selectors = [
-                "//button[contains(text(), 'Apply')]",
-                "//button[contains(text(), 'Easy Apply')]",
-                "//button[contains(text(), 'Apply now')]",
-                "//a[contains(text(), 'Apply')]",
-                "//button[contains(@class, 'apply')]",
-                "//button[contains(@class, 'jobs-apply')]",
-                "//div[contains(@class, 'apply')]//button",
-                "//span[contains(text(), 'Apply')]/parent::button"
-            ]
-            
-            for selector in apply_button_selectors:
-                try:
-                    apply_button = self.driver.find_element(By.XPATH, selector)
-                    if apply_button and apply_button.is_displayed() and apply_button.is_enabled():
-                        return apply_button
-                except:
-                    continue
-            
-            return None
+            return self._find_first_clickable(self.LINKEDIN_APPLY_BUTTON_XPATHS)
             
         except Exception as e:
             self.log_message(f"Error finding apply button: {str(e)}")
@@ -5078,44 +5398,24 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         """Get appropriate data for a field type"""
         # This would typically come from user profile or resume
         # For now, return placeholder data
-        field_data_map = {
-            'phone': '+1 (555) 123-4567',
-            'email': 'your.email@example.com',
-            'address': '123 Main St, City, State 12345',
-            'experience': '5+ years in software development',
-            'education': 'Bachelor\'s in Computer Science'
-        }
-        
-        return field_data_map.get(field_type, '')
+        return self.LINKEDIN_FIELD_PLACEHOLDERS.get(field_type, '')
 
     def _submit_linkedin_application(self, job_number):
         """Submit the LinkedIn application"""
         try:
             # Look for submit button
-            submit_selectors = [
-                "//button[contains(text(), 'Submit')]",
-                "//button[contains(@class, 'submit')]",
-                "//button[contains(@class, 'send')]"
-            ]
-            
-            for selector in submit_selectors:
-                try:
-                    submit_button = self.driver.find_element(By.XPATH, selector)
-                    if submit_button and submit_button.is_displayed() and submit_button.is_enabled():
-                        self.log_message(f"📤 Submitting application for job {job_number}")
-                        self._human_like_click(submit_button)
-                        self._human_like_delay(3, 5)
-                        
-                        # Check for success message
-                        if self._check_application_success():
-                            self.log_message(f"✅ Application submitted successfully for job {job_number}")
-                            return True
-                        else:
-                            self.log_message(f"⚠️ Application submission status unclear for job {job_number}")
-                            return True  # Assume success if we can't determine
-                            
-                except:
-                    continue
+            submit_button = self._find_first_clickable(self.LINKEDIN_SUBMIT_BUTTON_XPATHS)
+            if submit_button:
+                self.log_message(f"📤 Submitting application for job {job_number}")
+                self._human_like_click(submit_button)
+                self._human_like_delay(3, 5)
+                
+                # Check for success message
+                if self._check_application_success():
+                    self.log_message(f"✅ Application submitted successfully for job {job_number}")
+                else:
+                    self.log_message(f"⚠️ Application submission status unclear for job {job_number}")
+                return True  # Assume success if we can't determine
             
             self.log_message(f"⚠️ No submit button found for job {job_number}")
             return False
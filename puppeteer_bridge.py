@@ -3,6 +3,7 @@ import subprocess
 import os
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -50,9 +51,9 @@ class PuppeteerBridge:
                     "fingerprint-injector"
                 ]
                 
-                for dep in dependencies:
-                    logger.info(f"Installing {dep}...")
-                    subprocess.run(["npm", "install", dep], check=True, capture_output=True, shell=True)
+                # Install everything in one npm run so the dependency tree is resolved once
+                logger.info(f"Installing {', '.join(dependencies)}...")
+                subprocess.run(["npm", "install", *dependencies], check=True, capture_output=True, shell=True)
                 
                 logger.info("All Puppeteer dependencies installed successfully!")
             
@@ -861,10 +862,12 @@ module.exports = { main, launchBrowser, linkedinLogin, navigateToJobs, readJobDe
     
     def start_linkedin_automation(self, keywords: str, location: str, resume_path: str = None) -> bool:
         try:
-            if not self._ensure_node_dependencies():
-                return False
-            
-            self._create_puppeteer_script()
+            # Writing the script does not depend on npm, so do it while the install runs
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                dependencies_ready = executor.submit(self._ensure_node_dependencies)
+                self._create_puppeteer_script()
+                if not dependencies_ready.result():
+                    return False
             
             logger.info(f"Starting LinkedIn automation with Puppeteer...")
             logger.info(f"Keywords: {keywords}")
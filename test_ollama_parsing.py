@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test script for OllamaManager response parsing (no Ollama server needed)
+"""
+
+import json
+from unittest import mock
+
+from auto_job_applier import OllamaManager
+
+
+class FakeStreamResponse:
+    """Stand-in for a streamed /api/generate response"""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.sent = 0
+        self.closed = False
+
+    def iter_lines(self):
+        for piece in self.pieces:
+            self.sent += 1
+            yield json.dumps({"response": piece, "done": False}).encode()
+        yield json.dumps({"response": "", "done": True}).encode()
+
+    def close(self):
+        self.closed = True
+
+
+def make_manager():
+    """Create an OllamaManager without contacting a server"""
+    with mock.patch.object(OllamaManager, '_check_availability', return_value=True):
+        return OllamaManager()
+
+
+def test_read_stream_skips_prose_brackets():
+    """Brackets in prose before the answer must not end the stream"""
+    manager = make_manager()
+    response = FakeStreamResponse(["Here is the analysis [JSON]:\n", '{"compatibility_score": 88}', " trailing", " talk"])
+
+    assert manager._read_stream(response, '{') == '{"compatibility_score": 88}'
+    assert response.sent == 2
+    assert response.closed
+
+
+def test_read_stream_skips_braced_prose():
+    """A braced aside that is not JSON is skipped and the real object returned"""
+    manager = make_manager()
+    response = FakeStreamResponse(["Sure {note} ", '{"compatibility_score": 88}', " trailing"])
+
+    assert manager._read_stream(response, '{') == '{"compatibility_score": 88}'
+
+
+def test_read_stream_ignores_brackets_in_strings():
+    """Brackets and escaped quotes inside string values do not change the depth"""
+    manager = make_manager()
+    answer = '[{"job_index": 1, "reasoning": "uses \\"[]\\" and {}"}]'
+    response = FakeStreamResponse(["Result: ", answer[:20], answer[20:], " done"])
+
+    assert manager._read_stream(response, '[') == answer
+
+
+def test_read_stream_without_json_returns_text():
+    """With no JSON in the reply the whole text comes back"""
+    manager = make_manager()
+
+    assert manager._read_stream(FakeStreamResponse(["no json", " here"]), '{') == "no json here"
+    assert manager._read_stream(FakeStreamResponse(["a", "b"]), None) == "ab"
+
+
+def test_analyze_job_compatibility_parses_after_braced_prose():
+    """The analysis uses the object the stream parser found, not a greedy match"""
+    manager = make_manager()
+    manager.session.post = mock.Mock(return_value=mock.Mock(
+        status_code=200,
+        iter_lines=FakeStreamResponse(["Sure {note} ", '{"compatibility_score": 88}', " trailing"]).iter_lines
+    ))
+
+    assert manager.analyze_job_compatibility("job", "resume")["compatibility_score"] == 88
+
+
+def test_query_analysis_batch_uses_job_index():
+    """Entries are placed by job_index, whatever order they come back in"""
+    manager = make_manager()
+    manager.query = mock.Mock(return_value='[{"job_index": 2, "compatibility_score": 70}, '
+                                           '{"job_index": 1, "compatibility_score": 90}]')
+
+    analyses = manager._query_analysis_batch(["job a", "job b"], "resume")
+
+    assert [analysis["compatibility_score"] for analysis in analyses] == [90, 70]
+    assert all("job_index" not in analysis for analysis in analyses)
+
+
+def test_query_analysis_batch_missing_job_index():
+    """Entries without job_index fall back to their position"""
+    manager = make_manager()
+    manager.query = mock.Mock(return_value='[{"compatibility_score": 90}, {"compatibility_score": 70}]')
+
+    analyses = manager._query_analysis_batch(["job a", "job b"], "resume")
+
+    assert [analysis["compatibility_score"] for analysis in analyses] == [90, 70]
+
+
+def test_query_analysis_batch_duplicate_job_index():
+    """The first entry for a job wins; jobs nobody answered stay None"""
+    manager = make_manager()
+    manager.query = mock.Mock(return_value='[{"job_index": 1, "compatibility_score": 90}, '
+                                           '{"job_index": 1, "compatibility_score": 10}]')
+
+    analyses = manager._query_analysis_batch(["job a", "job b"], "resume")
+
+    assert analyses[0]["compatibility_score"] == 90
+    assert analyses[1] is None
+
+
+def test_query_analysis_batch_unusable_reply():
+    """A reply with no JSON array leaves every job for the per-job fallback"""
+    manager = make_manager()
+    manager.query = mock.Mock(return_value="Sorry [I can't] do that")
+
+    assert manager._query_analysis_batch(["job a", "job b"], "resume") == [None, None]
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Ollama response parsing...")
+
+    failures = 0
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            try:
+                test()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {name}: {e}")
+
+    print("\n🎉 All parsing tests passed!" if not failures else f"\n❌ {failures} parsing test(s) failed")
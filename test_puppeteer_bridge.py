@@ -5,6 +5,7 @@ Test script for PuppeteerBridge
 
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from puppeteer_bridge import PuppeteerBridge
 
 # Configure logging
@@ -19,22 +20,26 @@ def test_puppeteer_bridge():
     # Create bridge instance
     bridge = PuppeteerBridge()
     
-    # Test 1: Check if Node.js dependencies can be installed
-    print("\n1️⃣ Testing Node.js dependency installation...")
-    if bridge._ensure_node_dependencies():
-        print("✅ Node.js dependencies check passed")
-    else:
-        print("❌ Node.js dependencies check failed")
-        return False
-    
-    # Test 2: Test script creation
-    print("\n2️⃣ Testing Puppeteer script creation...")
-    try:
-        bridge._create_puppeteer_script()
-        print("✅ Puppeteer script created successfully")
-    except Exception as e:
-        print(f"❌ Failed to create Puppeteer script: {e}")
-        return False
+    # Tests 1 and 2 are independent: write the script while npm installs
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Test 1: Check if Node.js dependencies can be installed
+        print("\n1️⃣ Testing Node.js dependency installation...")
+        dependencies_ready = executor.submit(bridge._ensure_node_dependencies)
+        
+        # Test 2: Test script creation
+        print("\n2️⃣ Testing Puppeteer script creation...")
+        try:
+            bridge._create_puppeteer_script()
+            print("✅ Puppeteer script created successfully")
+        except Exception as e:
+            print(f"❌ Failed to create Puppeteer script: {e}")
+            return False
+        
+        if dependencies_ready.result():
+            print("✅ Node.js dependencies check passed")
+        else:
+            print("❌ Node.js dependencies check failed")
+            return False
     
     # Test 3: Test automation start (this will open browser)
     print("\n3️⃣ Testing LinkedIn automation start...")